@@ -6,6 +6,7 @@ conditions and binds the expected params.
 
 from __future__ import annotations
 
+import pytest
 from timedb.read import PgEngineMeta, _meta_cte
 
 _TABLE = "energydb_series_meta_pg"
@@ -43,7 +44,5 @@ def test_meta_cte_single_edge_triple_still_scalar():
 
 
 def test_meta_cte_requires_an_addressing_field():
-    import pytest
-
     with pytest.raises(ValueError, match="edge_triple / edge_triples"):
         _meta_cte(PgEngineMeta(table=_TABLE))
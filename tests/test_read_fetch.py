@@ -0,0 +1,95 @@
+"""Unit tests for the read-path plumbing — no ClickHouse required.
+
+NaN is the storage sentinel for a null value; ``_fetch`` must surface it as a
+real null regardless of how many Arrow chunks the driver returns. The entry
+points share one filter/meta-prefix builder and one polars conversion tail.
+"""
+
+from datetime import UTC, datetime, timedelta
+
+import polars as pl
+import pyarrow as pa
+from timedb.read import PgEngineMeta, _fetch, read, read_relative
+
+_COLS = ["series_id", "value"]
+
+
+class _ArrowClient:
+    def __init__(self, table: pa.Table):
+        self._table = table
+
+    def query_arrow(self, sql, parameters=None):  # noqa: ARG002
+        return self._table
+
+
+def _table(*chunks: list[float]) -> pa.Table:
+    values = pa.chunked_array([pa.array(c, type=pa.float64()) for c in chunks])
+    ids = pa.chunked_array([pa.array([1] * len(c), type=pa.uint64()) for c in chunks])
+    return pa.Table.from_arrays([ids, values], names=_COLS)
+
+
+def test_nan_values_become_nulls_across_chunks():
+    nan = float("nan")
+    out = _fetch(_ArrowClient(_table([1.0, nan], [nan, 4.0])), "", {}, _COLS)
+
+    assert out.column("value").to_pylist() == [1.0, None, None, 4.0]
+    df = pl.from_arrow(out)
+    assert isinstance(df, pl.DataFrame)
+    assert df.get_column("value").null_count() == 2
+
+
+def test_nan_free_values_pass_through_untouched():
+    table = _table([1.0, 2.0], [3.0])
+    out = _fetch(_ArrowClient(table), "", {}, _COLS)
+
+    assert out.column("value").null_count == 0
+    assert out.column("value").to_pylist() == [1.0, 2.0, 3.0]
+
+
+def test_empty_result_uses_typed_schema():
+    out = _fetch(_ArrowClient(pa.table({})), "", {}, _COLS)
+
+    assert out.num_rows == 0
+    assert out.schema.field("value").type == pa.float64()
+
+
+class _CapturingClient(_ArrowClient):
+    def __init__(self, table: pa.Table):
+        super().__init__(table)
+        self.sql: list[str] = []
+        self.params: list[dict] = []
+
+    def query_arrow(self, sql, parameters=None):
+        self.sql.append(sql)
+        self.params.append(parameters or {})
+        return self._table
+
+
+def test_read_and_read_relative_share_meta_prefix_and_params():
+    ms = PgEngineMeta(table="meta_pg", paths=("Grid/A",))
+    table = pa.table(
+        {
+            "series_id": pa.array([1], type=pa.uint64()),
+            "valid_time": pa.array([datetime(2024, 1, 1, tzinfo=UTC)], type=pa.timestamp("us", tz="UTC")),
+            "value": pa.array([1.0]),
+        }
+    )
+    client = _CapturingClient(table)
+    start = datetime(2024, 1, 1, tzinfo=UTC)
+
+    df = read(client, series_ids=[], meta_source=ms, start_valid=start)
+    read_relative(
+        client,
+        series_ids=[],
+        meta_source=ms,
+        window_length=timedelta(days=1),
+        issue_offset=timedelta(hours=-12),
+        start_valid=start,
+    )
+
+    assert df.columns == ["series_id", "valid_time", "value"]
+    for sql, params in zip(client.sql, client.params, strict=True):
+        assert "AS _meta" in sql
+        assert "series_id IN _meta.1" in sql
+        assert params["ms_paths"] == ["Grid/A"]
+        assert params["start_valid"] == start
@@ -1,6 +1,6 @@
 """Unit tests for write-time validation — no ClickHouse required."""
 
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 
 import polars as pl
 import pyarrow as pa
@@ -63,7 +63,7 @@ def _df(rows=3):
             interval="1h",
             time_unit="us",
             time_zone="UTC",
-            end=datetime(2024, 1, 1, tzinfo=UTC) + __import__("datetime").timedelta(hours=rows - 1),
+            end=datetime(2024, 1, 1, tzinfo=UTC) + timedelta(hours=rows - 1),
             eager=True,
         )
     return pl.DataFrame(
@@ -241,3 +241,18 @@ def test_unknown_unchanged_scope_rejected():
             skip_unchanged=True,
             unchanged_scope="bogus",  # ty: ignore[invalid-argument-type]
         )
+
+
+def test_empty_write_is_a_no_op():
+    """An empty batch returns before any read-back or insert."""
+    client = _RecordingClient()
+    res = write(client, _incoming([]), retention="medium", skip_unchanged=True)
+    assert (res.written, res.skipped) == (0, 0)
+    assert client.calls == []
+    assert client.query_calls == 0
+
+
+def test_empty_write_still_validates_kwargs():
+    client = _RecordingClient()
+    with pytest.raises(ValueError, match="Unknown retention"):
+        write(client, _incoming([]), retention="bogus")
@@ -12,6 +12,7 @@ from collections.abc import Sequence
 from datetime import datetime, timedelta
 from datetime import time as dt_time
 from importlib import resources
+from typing import Self
 
 import clickhouse_connect
 import clickhouse_connect.common
@@ -64,8 +65,28 @@ def _get_ch_connect_timeout() -> int:
 
 _DDL = resources.files("timedb").joinpath("sql", "ch_create_tables.sql").read_text(encoding="utf-8")
 
+
+def _split_ddl(ddl: str) -> list[str]:
+    """Split a DDL script into executable statements, dropping comment-only chunks."""
+    statements = []
+    for statement in ddl.split(";"):
+        s = statement.strip()
+        if any(ln.strip() and not ln.strip().startswith("--") for ln in s.splitlines()):
+            statements.append(s)
+    return statements
+
+
+_DDL_STATEMENTS = _split_ddl(_DDL)
+
 _CH_TABLES = ["series_values", "run_series"]
 
+_RUN_SERIES_SQL = """
+SELECT run_id
+FROM run_series FINAL
+WHERE series_id = {series_id:UInt64}
+ORDER BY first_seen DESC
+"""
+
 
 class TimeDBClient:
     # One CH client. The write path overlaps its ``series_values`` and
@@ -99,20 +120,24 @@ class TimeDBClient:
             autogenerate_session_id=False,
         )
 
+    def close(self) -> None:
+        """Close the CH client, releasing its pooled HTTP connections."""
+        self._ch.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
     # ------------------------------------------------------------------
     # Schema
     # ------------------------------------------------------------------
 
     def create(self) -> None:
         """Create the series_values table and run_series mapping."""
-        for statement in _DDL.split(";"):
-            s = statement.strip()
-            if not s:
-                continue
-            non_comment = [ln for ln in s.splitlines() if ln.strip() and not ln.strip().startswith("--")]
-            if not non_comment:
-                continue
-            self._ch.command(s)
+        for statement in _DDL_STATEMENTS:
+            self._ch.command(statement)
 
     def delete(self) -> None:
         """Drop both CH tables."""
@@ -204,11 +229,9 @@ class TimeDBClient:
 
         Data only — the ``energydb.runs`` PG table hydrates the metadata.
         """
-        sql = """
-        SELECT run_id
-        FROM run_series FINAL
-        WHERE series_id = {series_id:UInt64}
-        ORDER BY first_seen DESC
-        """
-        result = self._ch.query(sql, parameters={"series_id": series_id})
-        return [int(row[0]) for row in result.result_rows]
+        result = self._ch.query(_RUN_SERIES_SQL, parameters={"series_id": series_id})
+        # Column-oriented: the single ``run_id`` column is already a list of
+        # ints, so no per-row tuple is built just to index ``[0]``. A result
+        # with no blocks (no runs for this series) carries no columns at all.
+        cols = result.result_columns
+        return cols[0] if cols else []